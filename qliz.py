@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 import curses
+import heapq
 import json
+import os
 import time
 import re
 import random
@@ -9,6 +11,56 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson  # Optional, much faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads  # Both parse bytes directly
+
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+
+# Synchronized update mode (DECSET 2026): the terminal holds everything written
+# between these markers and paints it at once, so frames never show half drawn.
+BEGIN_SYNC = b"\x1b[?2026h"
+END_SYNC = b"\x1b[?2026l"
+SYNC_TERM_PROGRAMS = ('ghostty', 'iTerm.app', 'WezTerm')
+
+# Big-letter screen titles
+QLIZ_ART = (
+    "╔═══════════════════════════════╗",
+    "║         Q L I Z               ║",
+    "╚═══════════════════════════════╝",
+)
+GAME_OVER_ART = (
+    "╔═╗╔═╗╔╦╗╔═╗  ╔═╗╦  ╦╔═╗╦═╗",
+    "║ ╦╠═╣║║║║╣   ║ ║╚╗╔╝║╣ ╠╦╝",
+    "╚═╝╩ ╩╩ ╩╚═╝  ╚═╝ ╚╝ ╚═╝╩╚═",
+)
+TOP5_ART = (
+    "╔╦╗╔═╗╔═╗  ╔═╗  ╔═╗╦  ╔═╗╦ ╦╔═╗╦═╗╔═╗",
+    " ║ ║ ║╠═╝  ╚═╗  ╠═╝║  ╠═╣╚╦╝║╣ ╠╦╝╚═╗",
+    " ╩ ╚═╝╩    ╚═╝  ╩  ╩═╝╩ ╩ ╩ ╚═╝╩╚═╚═╝",
+)
+HISCORES_ART = (
+    "╦ ╦╦╔═╗╦ ╦  ╔═╗╔═╗╔═╗╦═╗╔═╗╔═╗",
+    "╠═╣║║ ╦╠═╣  ╚═╗║  ║ ║╠╦╝║╣ ╚═╗",
+    "╩ ╩╩╚═╝╩ ╩  ╚═╝╚═╝╚═╝╩╚═╚═╝╚═╝",
+)
+RANDOM_PICKER_ART = (
+    "╦═╗╔═╗╔╗╔╔╦╗╔═╗╔╦╗  ╔═╗╦╔═╗╦╔═╔═╗╦═╗",
+    "╠╦╝╠═╣║║║ ║║║ ║║║║  ╠═╝║║  ╠╩╗║╣ ╠╦╝",
+    "╩╚═╩ ╩╝╚╝═╩╝╚═╝╩ ╩  ╩  ╩╚═╝╩ ╩╚═╝╩╚═",
+)
+
+# Row colors for the podium: yellow 1st, white 2nd, magenta 3rd, cyan for the rest
+RANK_COLORS = (2, 6, 3)
+OTHER_RANK_COLOR = 1
+
+def score_rank(entry):
+    """Ranking key for scoreboard entries: higher score first, then faster time."""
+    return (-entry['score'], entry['total_time'])
+
 class Player:
     def __init__(self, name, email, marketing_consent=False):
         self.name = name
@@ -28,6 +80,23 @@ class Qliz:
         self.questions = []      # Selected questions for current game
         self.scoreboard_file = None  # Will be set from config
         self.stats_file = None  # Will be set from config
+        self._scoreboard_cache = None  # Parsed scoreboard, reread only when the file changes
+        self._scoreboard_mtime = None
+        self._best_score = None  # Best entry on the scoreboard, kept up to date by save_score
+        self._ranked_scores = {}  # limit (None for all) -> best scores in order, rebuilt after the scoreboard changes
+        self._score_pad = None  # (rows it was drawn from, pad) for the scrollable High Scores list
+        self._score_rows = {}  # (formatter name, limit) -> (ranked list it was built from, [(line, color), ...])
+        self._prev_frame = {'selected_idx': None, 'timer_filled': None, 'timer_seconds': None,
+                            'timer_color': None, 'question_num': None, 'size': None, 'options_y': None}
+        self._bar_filled = ""  # Full-width timer bar strings, sliced per frame
+        self._bar_empty = ""
+
+        # Quick select keys: a/A/1 -> option 0, b/B/2 -> option 1, ...
+        self._answer_keymap = {ord(c): i for i, keys in enumerate(zip('abcdef', 'ABCDEF', '123456')) for c in keys}
+        self._nav_keys = {curses.KEY_UP: -1, curses.KEY_DOWN: 1}
+        self._box_cache = {}  # width -> (top, side, bottom) border strings
+        self._art_lines = {}  # (start_y, art, color) -> [(y, x, line, color), ...] for the current size
+        self._big_titles = {}  # title text -> bordered lines for the current width
 
         # Setup curses
         curses.curs_set(0)  # Hide cursor
@@ -42,13 +111,21 @@ class Qliz:
         curses.init_pair(5, curses.COLOR_RED, -1)       # Red text
         curses.init_pair(6, curses.COLOR_WHITE, -1)     # White text
 
+        # Attribute values per color pair, so drawing code doesn't call color_pair() each time
+        self.CP = [curses.color_pair(i) for i in range(8)]
+        self.CP_BOLD = [c | curses.A_BOLD for c in self.CP]
+        self.CP_REV_BOLD = [c | curses.A_REVERSE | curses.A_BOLD for c in self.CP]
+
+        self._sync_updates = self.supports_sync_updates()
+        self._out_fd = sys.stdout.fileno()  # Same tty curses draws on, for the sync markers
+        self._h, self._w = stdscr.getmaxyx()  # Last known terminal size, see _handle_resize
+
         self.load_quiz_config()
 
     def load_quiz_config(self):
         """Load quiz configuration and questions from external JSON file."""
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = self.read_json(self.config_file)
 
             self.quiz_metadata = config.get('quiz_metadata', {})
             questions_data = config.get('questions', [])
@@ -56,7 +133,8 @@ class Qliz:
             # Set scoreboard file from config or use default
             self.scoreboard_file = self.quiz_metadata.get('scoreboard_file', 'scoreboard.json')
             # Set stats file from config or use default
-            self.stats_file = self.quiz_metadata.get('stats_file', 'stats.json')
+            self.stats_file = self.quiz_metadata.get('stats_file', 'stats.jsonl')
+            self.migrate_stats_file()
 
             # Load all available questions
             self.all_questions = []
@@ -88,103 +166,168 @@ class Qliz:
 
     def show_error(self, message):
         """Display error message and exit."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-        self.stdscr.addstr(h//2, (w - len(message))//2, message, curses.color_pair(5))
-        self.stdscr.refresh()
+        self.stdscr.erase()
+        h, w = self._h, self._w
+        self.stdscr.addstr(h//2, (w - len(message))//2, message, self.CP[5])
+        self.stdscr.noutrefresh()
+        self.flush_frame()
         self.stdscr.getch()
 
+    def _handle_resize(self):
+        """Pick up a new terminal size, returns True if the geometry actually changed."""
+        size = self.stdscr.getmaxyx()
+        if size == (self._h, self._w):
+            return False  # Nothing moved, screens just erase() and redraw
+
+        self._h, self._w = size
+        self._art_lines.clear()  # Centered positions depend on the width
+        self._big_titles.clear()  # So does the border length
+        curses.update_lines_cols()
+        # Genuine geometry change: repaint everything on the next refresh, but keep the
+        # window contents so screens that only redraw part of themselves stay intact
+        self.stdscr.clearok(True)
+        return True
+
+    def supports_sync_updates(self):
+        """Check whether the terminal understands synchronized update markers."""
+        if os.environ.get('TERM_PROGRAM') in SYNC_TERM_PROGRAMS or 'kitty' in os.environ.get('TERM', ''):
+            return True
+        # Terminals advertising the capability in terminfo (e.g. tmux) expose it as "Sync"
+        try:
+            return curses.tigetstr('Sync') is not None
+        except curses.error:
+            return False
+
+    def flush_frame(self):
+        """Push pending screen changes to the terminal as one synchronized update."""
+        if self._sync_updates:
+            # Raw writes: no text encoding or flush layers, one write(2) per marker
+            os.write(self._out_fd, BEGIN_SYNC)
+            curses.doupdate()
+            os.write(self._out_fd, END_SYNC)
+        else:
+            curses.doupdate()
+
     def draw_box(self, y, x, height, width, title="", color=1):
         """Draw a retro box with optional title."""
+        # Border strings only depend on the width, build them once
+        if width not in self._box_cache:
+            self._box_cache[width] = ("╔" + "═" * (width - 2) + "╗",
+                                      "║" + " " * (width - 2) + "║",
+                                      "╚" + "═" * (width - 2) + "╝")
+        top, side, bottom = self._box_cache[width]
+
         # Top border
-        self.stdscr.addstr(y, x, "╔" + "═" * (width - 2) + "╗", curses.color_pair(color))
+        self.stdscr.addstr(y, x, top, self.CP[color])
 
         # Title if provided
         if title:
             title_text = f" {title} "
             title_x = x + (width - len(title_text)) // 2
-            self.stdscr.addstr(y, title_x, title_text, curses.color_pair(color) | curses.A_BOLD)
+            self.stdscr.addstr(y, title_x, title_text, self.CP_BOLD[color])
 
-        # Sides
+        # Sides, one write per row
         for i in range(1, height - 1):
-            self.stdscr.addstr(y + i, x, "║", curses.color_pair(color))
-            self.stdscr.addstr(y + i, x + width - 1, "║", curses.color_pair(color))
+            self.stdscr.addstr(y + i, x, side, self.CP[color])
 
         # Bottom border
-        self.stdscr.addstr(y + height - 1, x, "╚" + "═" * (width - 2) + "╝", curses.color_pair(color))
+        self.stdscr.addstr(y + height - 1, x, bottom, self.CP[color])
 
     def center_text(self, y, text, color=6):
-        """Display centered text."""
-        h, w = self.stdscr.getmaxyx()
-        x = (w - len(text)) // 2
-        if 0 <= y < h and 0 <= x < w:
-            self.stdscr.addstr(y, x, text, curses.color_pair(color))
+        """Display centered text, cut to the terminal width."""
+        if 0 <= y < self._h:
+            w = self._w
+            self.stdscr.addnstr(y, max((w - len(text)) // 2, 0), text, w, self.CP[color])
+
+    def draw_art(self, start_y, art, color):
+        """Draw big-letter art centered, with line positions computed once per terminal size."""
+        key = (start_y, art, color)
+        lines = self._art_lines.get(key)
+        if lines is None:
+            lines = self._art_lines[key] = [
+                (start_y + i, (self._w - len(line)) // 2, line, color)
+                for i, line in enumerate(art)
+                if 0 <= start_y + i < self._h and 0 <= (self._w - len(line)) // 2 < self._w
+            ]
+        for y, x, line, color in lines:
+            self.stdscr.addstr(y, x, line, self.CP[color])
+
+    def blink_step(self, y, x, text, color, visible):
+        """Draw one phase of a blinking text and return the next phase."""
+        if visible:
+            self.stdscr.addstr(y, x, text, self.CP_BOLD[color])
+        else:
+            self.stdscr.hline(y, x, ' ', len(text))
+        self.stdscr.noutrefresh()
+        return not visible
 
     def blink_text(self, y, x, text, color=2, times=3):
-        """Make text blink."""
-        for _ in range(times):
-            self.stdscr.addstr(y, x, text, curses.color_pair(color) | curses.A_BOLD)
-            self.stdscr.refresh()
-            time.sleep(0.3)
-            self.stdscr.addstr(y, x, " " * len(text))
-            self.stdscr.refresh()
-            time.sleep(0.3)
-        self.stdscr.addstr(y, x, text, curses.color_pair(color) | curses.A_BOLD)
-
-    def draw_big_title(self, start_y, text, color=2):
-        """Draw title with decorative border."""
-        h, w = self.stdscr.getmaxyx()
-
-        # Add decorative top border
-        top_border = "═" * min(len(text) + 6, w - 4)
-        self.center_text(start_y, top_border, color=color)
+        """Make text blink until a key is pressed, or forever if times is None.
+
+        Returns the key that interrupted the blinking, or -1.
+        """
+        self.stdscr.timeout(300)
+        visible = True
+        phases = 0
+        key = -1
+
+        while times is None or phases < times * 2:
+            visible = self.blink_step(y, x, text, color, visible)
+            self.flush_frame()
+            key = self.stdscr.getch()
+            if key != -1:
+                break
+            phases += 1
 
-        # Main title text - large and bold
-        self.center_text(start_y + 1, f"╡ {text.upper()} ╞", color=color)
+        self.stdscr.timeout(-1)
+        self.stdscr.addstr(y, x, text, self.CP_BOLD[color])
+        return key
 
-        # Add decorative bottom border
-        bottom_border = "═" * min(len(text) + 6, w - 4)
-        self.center_text(start_y + 2, bottom_border, color=color)
+    def draw_big_title(self, start_y, text, color=2):
+        """Draw title with decorative border, built once per title and terminal width."""
+        lines = self._big_titles.get(text)
+        if lines is None:
+            # Decorative borders around the upper-cased title
+            border = "═" * min(len(text) + 6, self._w - 4)
+            lines = self._big_titles[text] = (border, f"╡ {text.upper()} ╞", border)
+        self.draw_art(start_y, lines, color)
 
     def show_title_screen(self):
         """Display 80s arcade title screen with branding from config."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-
         # Get quiz info from config
         title = self.quiz_metadata.get('title', 'QUIZ GAME')
         description = self.quiz_metadata.get('description', '')
 
-        start_y = h // 2 - 8
+        while True:
+            self.stdscr.erase()
+            h, w = self._h, self._w
 
-        # Qliz branding with decoration
-        qliz_art = [
-            "╔═══════════════════════════════╗",
-            "║         Q L I Z               ║",
-            "╚═══════════════════════════════╝"
-        ]
-        for i, line in enumerate(qliz_art):
-            self.center_text(start_y + i, line, color=1)
+            start_y = h // 2 - 8
 
-        # Game title with big styling
-        self.draw_big_title(start_y + 5, title, color=2)
+            # Qliz branding with decoration
+            self.draw_art(start_y, QLIZ_ART, color=1)
 
-        # Description with decorative brackets
-        if description:
-            desc_text = f"[ {description} ]"
-            self.center_text(start_y + 9, desc_text, color=6)
+            # Game title with big styling
+            self.draw_big_title(start_y + 5, title, color=2)
 
-        # Blinking "INSERT COIN" style prompt
-        prompt_y = h - 4
-        prompt_text = ">>> PRESS ANY KEY TO START <<<"
-        self.blink_text(prompt_y, (w - len(prompt_text)) // 2, prompt_text, color=2, times=2)
+            # Description with decorative brackets
+            if description:
+                desc_text = f"[ {description} ]"
+                self.center_text(start_y + 9, desc_text, color=6)
 
-        # Footer
-        footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
-        self.center_text(h - 2, footer_msg, color=6)
-        self.stdscr.refresh()
+            # Footer
+            footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
+            self.center_text(h - 2, footer_msg, color=6)
 
-        self.stdscr.getch()
+            # Blinking "INSERT COIN" style prompt, until a key is pressed
+            prompt_y = h - 4
+            prompt_text = ">>> PRESS ANY KEY TO START <<<"
+            key = self.blink_text(prompt_y, (w - len(prompt_text)) // 2, prompt_text, color=2, times=None)
+
+            # Re-layout after a terminal resize, any other key starts
+            if key != curses.KEY_RESIZE:
+                break
+            self._handle_resize()
 
     def get_input(self, y, x, prompt, max_length=30, validator=None):
         """Get user input with validation."""
@@ -192,9 +335,10 @@ class Qliz:
         curses.curs_set(1)
 
         while True:
-            self.stdscr.addstr(y, x, prompt, curses.color_pair(2))
-            self.stdscr.addstr(y, x + len(prompt), " " * max_length)
-            self.stdscr.refresh()
+            self.stdscr.addstr(y, x, prompt, self.CP[2])
+            self.stdscr.hline(y, x + len(prompt), ' ', max_length)
+            self.stdscr.noutrefresh()
+            self.flush_frame()
 
             try:
                 user_input = self.stdscr.getstr(y, x + len(prompt), max_length).decode('utf-8').strip()
@@ -206,11 +350,14 @@ class Qliz:
                 if valid:
                     break
                 else:
-                    self.stdscr.addstr(y + 1, x, " " * 60)
-                    self.stdscr.addstr(y + 1, x, message, curses.color_pair(5))
-                    self.stdscr.refresh()
+                    self.stdscr.move(y + 1, x)
+                    self.stdscr.clrtoeol()
+                    self.stdscr.addstr(y + 1, x, message, self.CP[5])
+                    self.stdscr.noutrefresh()
+                    self.flush_frame()
                     time.sleep(1.5)
-                    self.stdscr.addstr(y + 1, x, " " * 60)
+                    self.stdscr.move(y + 1, x)
+                    self.stdscr.clrtoeol()
             else:
                 if user_input:
                     break
@@ -223,8 +370,7 @@ class Qliz:
         """Validate email format."""
         if not email:
             return False, "Email cannot be empty"
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(pattern, email):
+        if EMAIL_RE.match(email):
             return True, ""
         return False, "Invalid email format"
 
@@ -243,7 +389,7 @@ class Qliz:
 
         while True:
             # Display question
-            self.stdscr.addstr(y, x, consent_text, curses.color_pair(2))
+            self.stdscr.addstr(y, x, consent_text, self.CP[2])
 
             # Display options
             option_y = y + 1
@@ -252,16 +398,17 @@ class Qliz:
                 option_x = x + 10 + (i * 15)
 
                 if i == selected:
-                    self.stdscr.addstr(option_y, option_x, option_text,
-                                     curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
+                    attr = self.CP_REV_BOLD[3]
                 else:
-                    self.stdscr.addstr(option_y, option_x, option_text, curses.color_pair(6))
+                    attr = self.CP[6]
+                self.stdscr.addstr(option_y, option_x, option_text, attr)
 
             # Instructions
             instruction_text = "(←/→ or Y/N to toggle, ENTER to confirm)"
-            self.stdscr.addstr(y + 3, x, instruction_text, curses.color_pair(6))
+            self.stdscr.addstr(y + 3, x, instruction_text, self.CP[6])
 
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            self.flush_frame()
 
             # Handle input
             key = self.stdscr.getch()
@@ -274,18 +421,21 @@ class Qliz:
                 selected = 0  # NO
             elif key in [ord('y'), ord('Y')]:
                 selected = 1  # YES
+            elif key == curses.KEY_RESIZE:
+                self._handle_resize()  # Keep the cached size current for the screens that follow
             elif key == ord('\n'):
                 # Clear the consent prompt area
                 for i in range(4):
-                    self.stdscr.addstr(y + i, x, " " * 60)
+                    self.stdscr.move(y + i, x)
+                    self.stdscr.clrtoeol()
                 return selected == 1  # Return True if YES selected
 
         return False
 
     def register_player(self):
         """Player registration screen."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
+        self.stdscr.erase()
+        h, w = self._h, self._w
 
         # Draw registration box (taller to accommodate consent)
         box_width = 60
@@ -302,15 +452,16 @@ class Qliz:
         # Get marketing consent
         marketing_consent = self.get_consent(box_y + 7, box_x + 3)
 
+        # getstr() swallows KEY_RESIZE, catch up on a resize during registration
+        self._handle_resize()
         return Player(name, email, marketing_consent)
 
     def draw_timer_bar(self, y, x, width, elapsed, timeout):
-        """Draw a progress bar for the timer."""
+        """Draw a progress bar for the timer, rewriting only the cells that changed."""
         remaining = max(0, timeout - elapsed)
         percentage = remaining / timeout
         filled = int(width * percentage)
-
-        bar = "█" * filled + "░" * (width - filled)
+        seconds = int(remaining)
 
         # Color based on time remaining
         if percentage > 0.5:
@@ -320,87 +471,132 @@ class Qliz:
         else:
             color = 5  # Red
 
-        self.stdscr.addstr(y, x, bar, curses.color_pair(color) | curses.A_BOLD)
-        time_text = f"{int(remaining)}s"
-        self.stdscr.addstr(y, x + width + 2, time_text, curses.color_pair(color))
+        # Full-width bars are built once and sliced every frame
+        if len(self._bar_filled) < width:
+            self._bar_filled = "█" * width
+            self._bar_empty = "░" * width
+
+        prev = self._prev_frame
+        last_filled = prev['timer_filled']
+        redraw = last_filled is None or color != prev['timer_color']
+        attr = self.CP_BOLD[color]
+
+        if redraw:
+            self.stdscr.addstr(y, x, self._bar_filled[:filled] + self._bar_empty[:width - filled], attr)
+        elif filled < last_filled:
+            self.stdscr.addstr(y, x + filled, self._bar_empty[:last_filled - filled], attr)
+        elif filled > last_filled:
+            self.stdscr.addstr(y, x + last_filled, self._bar_filled[:filled - last_filled], attr)
+
+        if redraw or seconds != prev['timer_seconds']:
+            time_text = f"{seconds}s"
+            self.stdscr.addstr(y, x + width + 2, time_text, self.CP[color])
+            self.stdscr.clrtoeol()
+
+        prev['timer_filled'] = filled
+        prev['timer_seconds'] = seconds
+        prev['timer_color'] = color
+
+    def draw_option(self, y, x, width, index, option, selected):
+        """Draw a single answer option row."""
+        # Padded to the full row width: fills the highlight bar, or wipes a previous one
+        option_text = f"[{index+1}] {option}".ljust(width)
+
+        if selected:
+            attr = self.CP_REV_BOLD[3]
+        else:
+            attr = self.CP[6]
+        self.stdscr.addstr(y, x, option_text, attr)
 
     def display_question(self, question_data, question_num, total_questions, selected_idx, score, elapsed_time, timeout):
-        """Display question screen with selection highlighting."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-
-        # Header
-        header = f"QUESTION {question_num}/{total_questions}"
-        score_text = f"SCORE: {score}/{total_questions}"
-
-        self.stdscr.addstr(1, 2, header, curses.color_pair(2) | curses.A_BOLD)
-        self.stdscr.addstr(1, w - len(score_text) - 2, score_text, curses.color_pair(1) | curses.A_BOLD)
+        """Display question screen, only redrawing what changed since the last frame."""
+        prev = self._prev_frame
+        h, w = self._h, self._w
 
-        # Timer bar
         timer_width = w - 10
-        self.draw_timer_bar(3, 5, timer_width, elapsed_time, timeout)
-
-        # Question box
-        question_lines = self.wrap_text(question_data['question'], w - 10)
-        box_height = len(question_lines) + len(question_data['options']) + 8
         box_y = 5
         box_x = 3
         box_width = w - 6
 
-        self.draw_box(box_y, box_x, box_height, box_width, color=1)
+        if question_num != prev['question_num'] or (h, w) != prev['size']:
+            # Full redraw on a new question or after a terminal resize
+            self.stdscr.erase()
 
-        # Display question
-        current_y = box_y + 2
-        for line in question_lines:
-            self.stdscr.addstr(current_y, box_x + 3, line, curses.color_pair(6))
-            current_y += 1
+            # Header
+            header = f"QUESTION {question_num}/{total_questions}"
+            score_text = f"SCORE: {score}/{total_questions}"
 
-        current_y += 1
+            self.stdscr.addstr(1, 2, header, self.CP_BOLD[2])
+            self.stdscr.addstr(1, w - len(score_text) - 2, score_text, self.CP_BOLD[1])
 
-        # Display options
-        for i, option in enumerate(question_data['options']):
-            option_text = f"[{i+1}] {option}"
+            # Question box, wrapped once per question and terminal width
+            if question_data.get('_wrap_width') != w:
+                question_data['_wrapped'] = self.wrap_text(question_data['question'], w - 10)
+                question_data['_wrap_width'] = w
+            question_lines = question_data['_wrapped']
+            box_height = len(question_lines) + len(question_data['options']) + 8
 
-            if i == selected_idx:
-                # Highlight selected option
-                self.stdscr.addstr(current_y, box_x + 3, " " * (box_width - 6), curses.color_pair(3) | curses.A_REVERSE)
-                self.stdscr.addstr(current_y, box_x + 3, option_text, curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
-            else:
-                self.stdscr.addstr(current_y, box_x + 3, option_text, curses.color_pair(6))
+            self.draw_box(box_y, box_x, box_height, box_width, color=1)
+
+            # Display question
+            current_y = box_y + 2
+            for line in question_lines:
+                self.stdscr.addstr(current_y, box_x + 3, line, self.CP[6])
+                current_y += 1
 
             current_y += 1
 
-        # Instructions
-        instructions = "↑/↓: Navigate  |  ENTER: Select  |  A-Z/1-4: Quick Select"
-        self.center_text(h - 2, instructions, color=2)
+            # Display options
+            for i, option in enumerate(question_data['options']):
+                self.draw_option(current_y + i, box_x + 3, box_width - 6, i, option, i == selected_idx)
 
-        self.stdscr.refresh()
+            # Instructions
+            instructions = "↑/↓: Navigate  |  ENTER: Select  |  A-Z/1-4: Quick Select"
+            self.center_text(h - 2, instructions, color=2)
+
+            prev['question_num'] = question_num
+            prev['size'] = (h, w)
+            prev['options_y'] = current_y
+            prev['timer_filled'] = None
+        elif selected_idx != prev['selected_idx']:
+            # Only repaint the two option rows whose highlight changed
+            options = question_data['options']
+            for i in (prev['selected_idx'], selected_idx):
+                self.draw_option(prev['options_y'] + i, box_x + 3, box_width - 6, i, options[i], i == selected_idx)
+
+        prev['selected_idx'] = selected_idx
+
+        # Timer bar, only when the visible state advanced
+        remaining = max(0, timeout - elapsed_time)
+        if (int(timer_width * (remaining / timeout)), int(remaining)) != (prev['timer_filled'], prev['timer_seconds']):
+            self.draw_timer_bar(3, 5, timer_width, elapsed_time, timeout)
+
+        self.stdscr.noutrefresh()
 
     def wrap_text(self, text, width):
-        """Wrap text to fit width."""
-        words = text.split()
+        """Wrap text to fit width, slicing lines straight out of the string in one pass."""
+        text = " ".join(text.split())  # Newlines, tabs and repeated spaces become single spaces
         lines = []
-        current_line = []
-        current_length = 0
+        start = 0
+        last_space = -1
 
-        for word in words:
-            if current_length + len(word) + len(current_line) <= width:
-                current_line.append(word)
-                current_length += len(word)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
+        for i, ch in enumerate(text):
+            if ch == ' ':
+                last_space = i
+            elif i - start >= width and last_space > start:
+                # Current line overflows, break it at the last space
+                lines.append(text[start:last_space])
+                start = last_space + 1
 
-        if current_line:
-            lines.append(" ".join(current_line))
+        tail = text[start:].rstrip()
+        if tail:
+            lines.append(tail)
 
         return lines
 
     def show_result(self, is_correct, correct_answer, explanation=""):
         """Show result animation."""
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._h, self._w
 
         if is_correct:
             text = "*** CORRECT! ***"
@@ -411,7 +607,8 @@ class Qliz:
 
         # Big result text
         result_y = h // 2
-        self.blink_text(result_y, (w - len(text)) // 2, text, color=color, times=2)
+        if self.blink_text(result_y, (w - len(text)) // 2, text, color=color, times=2) == curses.KEY_RESIZE:
+            self._handle_resize()  # The next question redraws at the new size
 
         # Show correct answer if wrong
         if not is_correct:
@@ -425,7 +622,8 @@ class Qliz:
             for i, line in enumerate(exp_lines):
                 self.center_text(start_y + i, line, color=6)
 
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        self.flush_frame()
         time.sleep(2)
 
     def play_game(self, player):
@@ -442,50 +640,59 @@ class Qliz:
         total_questions = len(self.questions)
 
         # Ready screen
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
+        while True:
+            self.stdscr.erase()
+            h = self._h
 
-        # Quiz title at the top
-        title = self.quiz_metadata.get('title', 'QUIZ GAME')
-        self.draw_big_title(2, title, color=2)
+            # Quiz title at the top
+            title = self.quiz_metadata.get('title', 'QUIZ GAME')
+            self.draw_big_title(2, title, color=2)
 
-        self.center_text(h//2 - 5, f"GET READY, {player.name.upper()}!", color=2)
-        self.center_text(h//2 - 3, f"{time_per_question} SECONDS PER QUESTION", color=6)
-        self.center_text(h//2 - 2, f"{total_questions} QUESTIONS", color=6)
+            self.center_text(h//2 - 5, f"GET READY, {player.name.upper()}!", color=2)
+            self.center_text(h//2 - 3, f"{time_per_question} SECONDS PER QUESTION", color=6)
+            self.center_text(h//2 - 2, f"{total_questions} QUESTIONS", color=6)
 
-        # Game instructions
-        self.center_text(h//2 + 1, "HOW TO PLAY:", color=2)
-        self.center_text(h//2 + 2, "Use ↑/↓ ARROW KEYS to navigate options", color=6)
-        self.center_text(h//2 + 3, "And press ENTER to confirm your choice", color=6)
-        self.center_text(h//2 + 4, " ", color=6)
-        self.center_text(h//2 + 5, "Or press 1-4 to quick select your answer", color=6)
+            # Game instructions
+            self.center_text(h//2 + 1, "HOW TO PLAY:", color=2)
+            self.center_text(h//2 + 2, "Use ↑/↓ ARROW KEYS to navigate options", color=6)
+            self.center_text(h//2 + 3, "And press ENTER to confirm your choice", color=6)
+            self.center_text(h//2 + 4, " ", color=6)
+            self.center_text(h//2 + 5, "Or press 1-4 to quick select your answer", color=6)
 
-        # Clear instruction for spacebar
-        spacebar_msg = ">>> PRESS SPACEBAR TO START THE GAME <<<"
-        self.center_text(h//2 + 7, spacebar_msg, color=2)
+            # Clear instruction for spacebar
+            spacebar_msg = ">>> PRESS SPACEBAR TO START THE GAME <<<"
+            self.center_text(h//2 + 7, spacebar_msg, color=2)
 
-        # Footer
-        footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
-        self.center_text(h - 2, footer_msg, color=6)
+            # Footer
+            footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
+            self.center_text(h - 2, footer_msg, color=6)
 
-        self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            self.flush_frame()
 
-        # Wait for spacebar press
-        while True:
+            # Wait for spacebar press, re-layout after a terminal resize
             key = self.stdscr.getch()
+            while key not in (ord(' '), curses.KEY_RESIZE):
+                key = self.stdscr.getch()
             if key == ord(' '):
                 break
+            self._handle_resize()
 
         total_time = 0
         correct_answers = 0
+        self._prev_frame['question_num'] = None  # Force a full redraw of the first question
 
         for i, question in enumerate(self.questions, 1):
             selected_idx = 0
             answered = False
+            opts = question['options']
+            n_options = len(opts)
             start_time = time.time()
             answer = None
 
-            self.stdscr.nodelay(True)  # Non-blocking input
+            self.stdscr.timeout(200)  # getch wakes up at least every 200ms to advance the timer
+            key = -1
+            last_render = None
 
             while not answered:
                 elapsed = time.time() - start_time
@@ -494,74 +701,32 @@ class Qliz:
                     # Timeout
                     break
 
-                self.display_question(question, i, total_questions, selected_idx, correct_answers, elapsed, time_per_question)
-
-                try:
-                    key = self.stdscr.getch()
-
-                    if key == curses.KEY_UP:
-                        selected_idx = (selected_idx - 1) % len(question['options'])
-                    elif key == curses.KEY_DOWN:
-                        selected_idx = (selected_idx + 1) % len(question['options'])
-                    elif key == ord('\n') or key == ord(' '):
-                        answer = selected_idx
+                # Only redraw when something visible changed: seconds shown, bar cells or selection
+                remaining = time_per_question - elapsed
+                timer_width = self._w - 10
+                render_state = (int(remaining), int(timer_width * (remaining / time_per_question)), selected_idx)
+                if render_state != last_render or key == curses.KEY_RESIZE:
+                    self.display_question(question, i, total_questions, selected_idx, correct_answers, elapsed, time_per_question)
+                    self.flush_frame()
+                    last_render = render_state
+
+                key = self.stdscr.getch()
+
+                if key == curses.KEY_RESIZE:
+                    self._handle_resize()
+                elif key in self._nav_keys:
+                    selected_idx = (selected_idx + self._nav_keys[key]) % n_options
+                elif key == ord('\n') or key == ord(' '):
+                    answer = selected_idx
+                    answered = True
+                else:
+                    # Letter keys (A-F) and number keys (1-6)
+                    idx = self._answer_keymap.get(key)
+                    if idx is not None and idx < n_options:
+                        answer = idx
                         answered = True
-                    # Letter keys (A-F)
-                    elif key in [ord('a'), ord('A')]:
-                        if len(question['options']) > 0:
-                            answer = 0
-                            answered = True
-                    elif key in [ord('b'), ord('B')]:
-                        if len(question['options']) > 1:
-                            answer = 1
-                            answered = True
-                    elif key in [ord('c'), ord('C')]:
-                        if len(question['options']) > 2:
-                            answer = 2
-                            answered = True
-                    elif key in [ord('d'), ord('D')]:
-                        if len(question['options']) > 3:
-                            answer = 3
-                            answered = True
-                    elif key in [ord('e'), ord('E')]:
-                        if len(question['options']) > 4:
-                            answer = 4
-                            answered = True
-                    elif key in [ord('f'), ord('F')]:
-                        if len(question['options']) > 5:
-                            answer = 5
-                            answered = True
-                    # Number keys (1-6)
-                    elif key in [ord('1')]:
-                        if len(question['options']) > 0:
-                            answer = 0
-                            answered = True
-                    elif key in [ord('2')]:
-                        if len(question['options']) > 1:
-                            answer = 1
-                            answered = True
-                    elif key in [ord('3')]:
-                        if len(question['options']) > 2:
-                            answer = 2
-                            answered = True
-                    elif key in [ord('4')]:
-                        if len(question['options']) > 3:
-                            answer = 3
-                            answered = True
-                    elif key in [ord('5')]:
-                        if len(question['options']) > 4:
-                            answer = 4
-                            answered = True
-                    elif key in [ord('6')]:
-                        if len(question['options']) > 5:
-                            answer = 5
-                            answered = True
-                except:
-                    pass
-
-                time.sleep(0.05)  # Small delay to reduce CPU usage
-
-            self.stdscr.nodelay(False)  # Restore blocking input
+
+            self.stdscr.timeout(-1)  # Restore blocking input
 
             time_taken = time.time() - start_time
 
@@ -570,21 +735,21 @@ class Qliz:
             if answer is None:
                 # Timeout
                 total_time += time_per_question
-                self.show_result(False, question['options'][question['correct']], "")
+                self.show_result(False, opts[question['correct']], "")
             elif answer == question['correct']:
                 is_correct = True
                 correct_answers += 1
                 total_time += time_taken
-                self.show_result(True, question['options'][question['correct']], "")
+                self.show_result(True, opts[question['correct']], "")
             else:
                 total_time += time_taken
-                self.show_result(False, question['options'][question['correct']], "")
+                self.show_result(False, opts[question['correct']], "")
 
             # Record question details for statistics
             question_detail = {
                 "question_id": question.get('id', 0),
                 "question_text": question['question'],
-                "options": question['options'],
+                "options": opts,
                 "correct_answer": question['correct'],
                 "player_answer": answer,
                 "is_correct": is_correct,
@@ -602,59 +767,51 @@ class Qliz:
 
     def show_game_over(self, player, total_questions):
         """Game over screen."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-
-        # GAME OVER text
-        game_over1 = "╔═╗╔═╗╔╦╗╔═╗  ╔═╗╦  ╦╔═╗╦═╗"
-        game_over2 = "║ ╦╠═╣║║║║╣   ║ ║╚╗╔╝║╣ ╠╦╝"
-        game_over3 = "╚═╝╩ ╩╩ ╩╚═╝  ╚═╝ ╚╝ ╚═╝╩╚═"
+        # Check if high score, loading the scoreboard keeps _best_score current
+        self.load_scoreboard()
+        # First player always gets high score, otherwise better score OR (same score AND faster time)
+        best_score = self._best_score
+        is_high_score = best_score is None or (-player.score, player.total_time) < score_rank(best_score)
 
-        self.center_text(3, game_over1, color=5)
-        self.center_text(4, game_over2, color=5)
-        self.center_text(5, game_over3, color=5)
-
-        # Results box
-        box_width = 50
-        box_height = 10
-        box_x = (w - box_width) // 2
-        box_y = 8
+        while True:
+            self.stdscr.erase()
+            h, w = self._h, self._w
 
-        self.draw_box(box_y, box_x, box_height, box_width, "FINAL SCORE", color=2)
+            # GAME OVER text
+            self.draw_art(3, GAME_OVER_ART, color=5)
 
-        # Display stats
-        self.stdscr.addstr(box_y + 3, box_x + 5, f"PLAYER: {player.name}", curses.color_pair(6))
-        self.stdscr.addstr(box_y + 5, box_x + 5, f"SCORE: {player.score}/{total_questions}", curses.color_pair(2) | curses.A_BOLD)
-        self.stdscr.addstr(box_y + 6, box_x + 5, f"TIME: {player.total_time:.1f}s", curses.color_pair(1))
+            # Results box
+            box_width = 50
+            box_height = 10
+            box_x = (w - box_width) // 2
+            box_y = 8
 
-        # Check if high score
-        scoreboard_data = self.load_scoreboard()
-        scores = scoreboard_data.get('scores', [])
-        is_high_score = False
+            self.draw_box(box_y, box_x, box_height, box_width, "FINAL SCORE", color=2)
 
-        if not scores:
-            # First player always gets high score
-            is_high_score = True
-        else:
-            sorted_scores = sorted(scores, key=lambda x: (-x['score'], x['total_time']))
-            best_score = sorted_scores[0]
+            # Display stats
+            self.stdscr.addstr(box_y + 3, box_x + 5, f"PLAYER: {player.name}", self.CP[6])
+            self.stdscr.addstr(box_y + 5, box_x + 5, f"SCORE: {player.score}/{total_questions}", self.CP_BOLD[2])
+            self.stdscr.addstr(box_y + 6, box_x + 5, f"TIME: {player.total_time:.1f}s", self.CP[1])
 
-            # New high score if: better score OR (same score AND faster time)
-            if player.score > best_score['score']:
-                is_high_score = True
-            elif player.score == best_score['score'] and player.total_time < best_score['total_time']:
-                is_high_score = True
+            self.center_text(h - 3, "Press any key to continue...", color=6)
 
-        if is_high_score:
-            hs_text = "*** NEW HIGH SCORE! ***"
-            self.blink_text(box_y + 8, box_x + (box_width - len(hs_text)) // 2, hs_text, color=2, times=3)
+            if is_high_score:
+                # Blink until the player presses a key
+                hs_text = "*** NEW HIGH SCORE! ***"
+                key = self.blink_text(box_y + 8, box_x + (box_width - len(hs_text)) // 2, hs_text, color=2, times=None)
+            else:
+                self.stdscr.noutrefresh()
+                self.flush_frame()
+                key = self.stdscr.getch()
 
-        self.center_text(h - 3, "Press any key to continue...", color=6)
-        self.stdscr.refresh()
-        self.stdscr.getch()
+            # Re-layout after a terminal resize, any other key continues
+            if key != curses.KEY_RESIZE:
+                break
+            self._handle_resize()
 
     def save_score(self, player):
         """Save player score to scoreboard."""
+        # Revalidate right before writing, another kiosk may have saved a score meanwhile
         scoreboard_data = self.load_scoreboard()
 
         # Get scores array and metadata
@@ -679,25 +836,79 @@ class Qliz:
             "scores": scores
         }
 
-        with open(self.scoreboard_file, 'w') as f:
-            json.dump(scoreboard, f, indent=2)
+        self.write_json(self.scoreboard_file, scoreboard)
+        self._scoreboard_cache = scoreboard
+        self._scoreboard_mtime = os.stat(self.scoreboard_file).st_mtime_ns
+        if self._best_score is None or score_rank(player_data) < score_rank(self._best_score):
+            self._best_score = player_data
+        self._ranked_scores.clear()
 
     def load_scoreboard(self):
-        """Load scoreboard from file."""
+        """Load scoreboard from file, rereading it only when its mtime changes."""
         try:
-            with open(self.scoreboard_file, 'r') as f:
-                data = json.load(f)
+            mtime = os.stat(self.scoreboard_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._scoreboard_cache is None or mtime != self._scoreboard_mtime:
+            try:
+                data = self.read_json(self.scoreboard_file)
                 # Handle both old format (array) and new format (dict with metadata)
                 if isinstance(data, list):
-                    return {"scores": data}
-                return data
-        except FileNotFoundError:
-            return {"scores": []}
+                    data = {"scores": data}
+            except FileNotFoundError:
+                data = {"scores": []}
+            self._scoreboard_cache = data
+            self._scoreboard_mtime = mtime
+            self._best_score = min(data.get('scores', []), key=score_rank, default=None)
+            self._ranked_scores.clear()
+        return self._scoreboard_cache
+
+    def ranked_scores(self, limit=None):
+        """Best scoreboard entries first, all of them or the top limit, once per scoreboard change."""
+        scores = self.load_scoreboard().get('scores', [])
+        ranked = self._ranked_scores.get(limit)
+        if ranked is None:
+            full = self._ranked_scores.get(None)
+            if full is not None:
+                ranked = full[:limit]
+            elif limit is None:
+                ranked = sorted(scores, key=score_rank)
+            else:
+                # Top N in one pass without sorting the whole scoreboard
+                ranked = heapq.nsmallest(limit, scores, key=score_rank)
+            self._ranked_scores[limit] = ranked
+        return ranked
+
+    def score_rows(self, format_row, limit):
+        """Formatted (line, color) rows for the top entries, rebuilt only when the ranking changes."""
+        ranked = self.ranked_scores(limit)
+        cache_key = (format_row.__name__, limit)
+        cached = self._score_rows.get(cache_key)
+        if cached is None or cached[0] is not ranked:
+            colors = RANK_COLORS[:len(ranked)] + (OTHER_RANK_COLOR,) * (len(ranked) - len(RANK_COLORS))
+            rows = [(format_row(f"{i}.", score), color)
+                    for i, (score, color) in enumerate(zip(ranked, colors), 1)]
+            cached = self._score_rows[cache_key] = (ranked, rows)
+        return cached[1]
+
+    def format_top5_row(self, rank, score):
+        """One Top 5 table line, with email."""
+        name = score['name'][:16]
+        email = score.get('email', 'N/A')[:28]
+        score_text = f"{score['score']}"
+        time_text = f"{score['total_time']:.1f}s"
+        return f"{rank:<4} {name:<18} {email:<30} {score_text:<8} {time_text:<10}"
+
+    def format_scoreboard_row(self, rank, score):
+        """One High Scores table line."""
+        name = score['name'][:18]
+        score_text = f"{score['score']}"
+        time_text = f"{score['total_time']:.1f}s"
+        return f"{rank:<4} {name:<20} {score_text:<10} {time_text:<10}"
 
     def save_game_stats(self, player):
-        """Save detailed game statistics to stats file."""
-        stats_data = self.load_stats()
-
+        """Append this game's detailed statistics to the stats file (JSON Lines)."""
         game_stats = {
             "player_name": player.name,
             "player_email": player.email,
@@ -708,258 +919,320 @@ class Qliz:
             "questions": player.question_details
         }
 
-        stats_data.append(game_stats)
-
-        with open(self.stats_file, 'w') as f:
-            json.dump(stats_data, f, indent=2)
+        if orjson is not None:
+            line = orjson.dumps(game_stats)
+        else:
+            line = json.dumps(game_stats, separators=(',', ':')).encode('utf-8')
+
+        with open(self.stats_file, 'ab') as f:
+            f.write(line + b'\n')
+
+    def migrate_stats_file(self):
+        """Convert stats saved by older versions as a single JSON array to JSON Lines."""
+        stats_path = Path(self.stats_file)
+        # Older configs used a .json name for the same file
+        source = stats_path if stats_path.exists() else stats_path.with_suffix('.json')
+        if not source.exists():
+            return
+
+        with open(source, 'r') as f:
+            if f.read(1) != '[':
+                return  # Already JSON Lines
+            f.seek(0)
+            games = json.load(f)
+
+        tmp_path = f"{stats_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            for game_stats in games:
+                f.write(json.dumps(game_stats, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, stats_path)
+
+    def read_json(self, path):
+        """Read and parse a JSON file as bytes, skipping the text decode step."""
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+
+    def write_json(self, path, data):
+        """Write JSON to a temp file and swap it in, so a crash never truncates the original."""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
-    def load_stats(self):
-        """Load statistics from file."""
-        try:
-            with open(self.stats_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
 
     def display_top5_with_emails(self):
         """Display top 5 players with email addresses."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-
         scoreboard_data = self.load_scoreboard()
         scores = scoreboard_data.get('scores', [])
         quiz_title = scoreboard_data.get('quiz_title', 'Quiz')
 
-        # Title
-        title1 = "╔╦╗╔═╗╔═╗  ╔═╗  ╔═╗╦  ╔═╗╦ ╦╔═╗╦═╗╔═╗"
-        title2 = " ║ ║ ║╠═╝  ╚═╗  ╠═╝║  ╠═╣╚╦╝║╣ ╠╦╝╚═╗"
-        title3 = " ╩ ╚═╝╩    ╚═╝  ╩  ╩═╝╩ ╩ ╩ ╚═╝╩╚═╚═╝"
+        while True:
+            self.stdscr.erase()
+            h, w = self._h, self._w
 
-        self.center_text(2, title1, color=2)
-        self.center_text(3, title2, color=2)
-        self.center_text(4, title3, color=2)
+            # Title
+            self.draw_art(2, TOP5_ART, color=2)
 
-        # Show quiz title
-        self.center_text(6, quiz_title, color=1)
+            # Show quiz title
+            self.center_text(6, quiz_title, color=1)
 
-        if not scores:
-            self.center_text(h//2, "NO SCORES YET - BE THE FIRST!", color=5)
-        else:
-            sorted_scores = sorted(scores, key=lambda x: (-x['score'], x['total_time']))[:5]
+            if not scores:
+                self.center_text(h//2, "NO SCORES YET - BE THE FIRST!", color=5)
+            else:
+                rows = self.score_rows(self.format_top5_row, 5)
 
-            # Scoreboard box
-            box_width = min(80, w - 10)
-            box_height = min(len(sorted_scores) + 5, h - 10)
-            box_x = (w - box_width) // 2
-            box_y = 8
+                # Scoreboard box
+                box_width = min(80, w - 10)
+                box_height = min(len(rows) + 5, h - 10)
+                box_x = (w - box_width) // 2
+                box_y = 8
 
-            self.draw_box(box_y, box_x, box_height, box_width, color=1)
+                self.draw_box(box_y, box_x, box_height, box_width, color=1)
 
-            # Header
-            header = f"{'#':<4} {'NAME':<18} {'EMAIL':<30} {'SCORE':<8} {'TIME':<10}"
-            self.stdscr.addstr(box_y + 2, box_x + 3, header, curses.color_pair(2) | curses.A_BOLD)
-
-            # Scores
-            for i, score in enumerate(sorted_scores, 1):
-                rank = str(i) + "."
-                name = score['name'][:16]
-                email = score.get('email', 'N/A')[:28]
-                score_text = f"{score['score']}"
-                time_text = f"{score['total_time']:.1f}s"
-
-                # Color based on rank
-                if i == 1:
-                    color = 2  # Yellow for 1st
-                elif i == 2:
-                    color = 6  # White for 2nd
-                elif i == 3:
-                    color = 3  # Magenta for 3rd
-                else:
-                    color = 1  # Cyan for others
+                # Header
+                header = f"{'#':<4} {'NAME':<18} {'EMAIL':<30} {'SCORE':<8} {'TIME':<10}"
+                self.stdscr.addstr(box_y + 2, box_x + 3, header, self.CP_BOLD[2])
 
-                line = f"{rank:<4} {name:<18} {email:<30} {score_text:<8} {time_text:<10}"
-                self.stdscr.addstr(box_y + 3 + i, box_x + 3, line, curses.color_pair(color))
+                # Scores
+                addstr, cp = self.stdscr.addstr, self.CP
+                for i, (line, color) in enumerate(rows, 1):
+                    addstr(box_y + 3 + i, box_x + 3, line, cp[color])
 
-        self.center_text(h - 2, "Press any key to return...", color=6)
-        self.stdscr.refresh()
-        self.stdscr.getch()
+            self.center_text(h - 2, "Press any key to return...", color=6)
+            self.stdscr.noutrefresh()
+            self.flush_frame()
+            key = self.stdscr.getch()
 
-    def display_scoreboard(self):
-        """Display arcade-style scoreboard."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
+            # Re-layout after a terminal resize, any other key returns
+            if key != curses.KEY_RESIZE:
+                break
+            self._handle_resize()
+
+    def scoreboard_pad(self, rows):
+        """Pad holding every High Scores row, drawn once per ranking change."""
+        if self._score_pad is None or self._score_pad[0] is not rows:
+            # One spare row and column so writing the last cell never fails
+            pad = curses.newpad(len(rows) + 1, max(len(line) for line, _ in rows) + 1)
+            addstr, cp = pad.addstr, self.CP
+            for i, (line, color) in enumerate(rows):
+                addstr(i, 0, line, cp[color])
+            self._score_pad = (rows, pad)
+        return self._score_pad[1]
 
+    def display_scoreboard(self):
+        """Display arcade-style scoreboard, scrollable with the arrow keys."""
         scoreboard_data = self.load_scoreboard()
         scores = scoreboard_data.get('scores', [])
         quiz_title = scoreboard_data.get('quiz_title', 'Quiz')
+        top = 0  # First pad row in the viewport
 
-        # Title
-        title1 = "╦ ╦╦╔═╗╦ ╦  ╔═╗╔═╗╔═╗╦═╗╔═╗╔═╗"
-        title2 = "╠═╣║║ ╦╠═╣  ╚═╗║  ║ ║╠╦╝║╣ ╚═╗"
-        title3 = "╩ ╩╩╚═╝╩ ╩  ╚═╝╚═╝╚═╝╩╚═╚═╝╚═╝"
+        while True:
+            self.stdscr.erase()
+            h, w = self._h, self._w
 
-        self.center_text(2, title1, color=2)
-        self.center_text(3, title2, color=2)
-        self.center_text(4, title3, color=2)
+            # Title
+            self.draw_art(2, HISCORES_ART, color=2)
 
-        # Show quiz title
-        self.center_text(6, quiz_title, color=1)
+            # Show quiz title
+            self.center_text(6, quiz_title, color=1)
 
-        if not scores:
-            self.center_text(h//2, "NO SCORES YET - BE THE FIRST!", color=5)
-        else:
-            sorted_scores = sorted(scores, key=lambda x: (-x['score'], x['total_time']))[:10]
+            view_rows = 0
+            if not scores:
+                self.center_text(h//2, "NO SCORES YET - BE THE FIRST!", color=5)
+            else:
+                rows = self.score_rows(self.format_scoreboard_row, None)
+                pad = self.scoreboard_pad(rows)
 
-            # Scoreboard box
-            box_width = min(70, w - 10)
-            box_height = min(len(sorted_scores) + 5, h - 10)
-            box_x = (w - box_width) // 2
-            box_y = 8
+                # Scoreboard box
+                box_width = min(70, w - 10)
+                box_height = min(len(rows) + 5, h - 10)
+                box_x = (w - box_width) // 2
+                box_y = 8
 
-            self.draw_box(box_y, box_x, box_height, box_width, color=1)
+                self.draw_box(box_y, box_x, box_height, box_width, color=1)
 
-            # Header
-            header = f"{'#':<4} {'NAME':<20} {'SCORE':<10} {'TIME':<10}"
-            self.stdscr.addstr(box_y + 2, box_x + 3, header, curses.color_pair(2) | curses.A_BOLD)
-
-            # Scores
-            for i, score in enumerate(sorted_scores, 1):
-                rank = str(i) + "."
-                name = score['name'][:18]
-                score_text = f"{score['score']}"
-                time_text = f"{score['total_time']:.1f}s"
-
-                # Color based on rank
-                if i == 1:
-                    color = 2  # Yellow for 1st
-                elif i == 2:
-                    color = 6  # White for 2nd
-                elif i == 3:
-                    color = 3  # Magenta for 3rd
-                else:
-                    color = 1  # Cyan for others
+                # Header
+                header = f"{'#':<4} {'NAME':<20} {'SCORE':<10} {'TIME':<10}"
+                self.stdscr.addstr(box_y + 2, box_x + 3, header, self.CP_BOLD[2])
 
-                line = f"{rank:<4} {name:<20} {score_text:<10} {time_text:<10}"
-                self.stdscr.addstr(box_y + 3 + i, box_x + 3, line, curses.color_pair(color))
+                # Scores are shown through a viewport on the pad
+                view_rows = box_height - 5
+                max_top = max(0, len(rows) - view_rows)
+                top = min(top, max_top)
+                viewport = (box_y + 4, box_x + 3, box_y + box_height - 2, box_x + box_width - 3)
 
-        self.center_text(h - 2, "Press any key to return...", color=6)
-        self.stdscr.refresh()
-        self.stdscr.getch()
+            if view_rows > 0 and max_top:
+                self.center_text(h - 2, "↑/↓: Scroll  |  Any other key to return...", color=6)
+            else:
+                self.center_text(h - 2, "Press any key to return...", color=6)
+            self.stdscr.noutrefresh()
+            if view_rows > 0:
+                pad.noutrefresh(top, 0, *viewport)
+            self.flush_frame()
+            key = self.stdscr.getch()
+
+            # Scrolling only moves the pad viewport, the rest of the screen stays as is
+            while view_rows > 0 and max_top and key in self._nav_keys:
+                new_top = min(max(top + self._nav_keys[key], 0), max_top)
+                if new_top != top:
+                    top = new_top
+                    pad.noutrefresh(top, 0, *viewport)
+                    self.flush_frame()
+                key = self.stdscr.getch()
+
+            # Re-layout after a terminal resize, any other key returns
+            if key != curses.KEY_RESIZE:
+                break
+            self._handle_resize()
 
     def random_player_picker(self):
         """Display total players and randomly pick one showing name and email."""
-        self.stdscr.clear()
-        h, w = self.stdscr.getmaxyx()
-
         scoreboard_data = self.load_scoreboard()
         scores = scoreboard_data.get('scores', [])
         quiz_title = scoreboard_data.get('quiz_title', 'Quiz')
 
-        # Title
-        title1 = "╦═╗╔═╗╔╗╔╔╦╗╔═╗╔╦╗  ╔═╗╦╔═╗╦╔═╔═╗╦═╗"
-        title2 = "╠╦╝╠═╣║║║ ║║║ ║║║║  ╠═╝║║  ╠╩╗║╣ ╠╦╝"
-        title3 = "╩╚═╩ ╩╝╚╝═╩╝╚═╝╩ ╩  ╩  ╩╚═╝╩ ╩╚═╝╩╚═"
-
-        self.center_text(2, title1, color=2)
-        self.center_text(3, title2, color=2)
-        self.center_text(4, title3, color=2)
-
-        # Show quiz title
-        self.center_text(6, quiz_title, color=1)
-
-        if not scores:
-            self.center_text(h//2, "NO PLAYERS YET - BE THE FIRST!", color=5)
-        else:
+        if scores:
             # Count total players
             total_players = len(scores)
 
-            # Randomly select one player
-            selected_player = random.choice(scores)
-
-            # Display box
-            box_width = min(70, w - 10)
-            box_height = 10
-            box_x = (w - box_width) // 2
-            box_y = (h - box_height) // 2
-
-            self.draw_box(box_y, box_x, box_height, box_width, "LUCKY WINNER", color=3)
-
-            # Total players
-            total_text = f"TOTAL PLAYERS: {total_players}"
-            self.stdscr.addstr(box_y + 2, box_x + (box_width - len(total_text)) // 2,
-                             total_text, curses.color_pair(2) | curses.A_BOLD)
+            # Randomly select one player, kept across a re-layout
+            selected_player = scores[random.randrange(total_players)]
 
-            # Separator
-            separator = "─" * (box_width - 6)
-            self.stdscr.addstr(box_y + 4, box_x + 3, separator, curses.color_pair(1))
+        while True:
+            self.stdscr.erase()
+            h, w = self._h, self._w
 
-            # Selected player info
-            name_text = f"NAME: {selected_player['name']}"
-            email_text = f"EMAIL: {selected_player.get('email', 'N/A')}"
+            # Title
+            self.draw_art(2, RANDOM_PICKER_ART, color=2)
 
-            self.stdscr.addstr(box_y + 6, box_x + 5, name_text,
-                             curses.color_pair(4) | curses.A_BOLD)
-            self.stdscr.addstr(box_y + 7, box_x + 5, email_text,
-                             curses.color_pair(6))
+            # Show quiz title
+            self.center_text(6, quiz_title, color=1)
 
-        self.center_text(h - 2, "Press any key to return...", color=6)
-        self.stdscr.refresh()
-        self.stdscr.getch()
+            if not scores:
+                self.center_text(h//2, "NO PLAYERS YET - BE THE FIRST!", color=5)
+            else:
+                # Display box
+                box_width = min(70, w - 10)
+                box_height = 10
+                box_x = (w - box_width) // 2
+                box_y = (h - box_height) // 2
+
+                self.draw_box(box_y, box_x, box_height, box_width, "LUCKY WINNER", color=3)
+
+                # Total players
+                total_text = f"TOTAL PLAYERS: {total_players}"
+                self.stdscr.addstr(box_y + 2, box_x + (box_width - len(total_text)) // 2,
+                                 total_text, self.CP_BOLD[2])
+
+                # Separator
+                self.stdscr.hline(box_y + 4, box_x + 3, curses.ACS_HLINE | self.CP[1], box_width - 6)
+
+                # Selected player info
+                name_text = f"NAME: {selected_player['name']}"
+                email_text = f"EMAIL: {selected_player.get('email', 'N/A')}"
+
+                self.stdscr.addstr(box_y + 6, box_x + 5, name_text,
+                                 self.CP_BOLD[4])
+                self.stdscr.addstr(box_y + 7, box_x + 5, email_text,
+                                 self.CP[6])
+
+            self.center_text(h - 2, "Press any key to return...", color=6)
+            self.stdscr.noutrefresh()
+            self.flush_frame()
+            key = self.stdscr.getch()
 
-    def main_menu(self):
-        """Main menu with branding from config."""
-        menu_options = ["PLAY GAME", "HIGH SCORES", "TOP 5 PLAYERS", "RANDOM PLAYER", "EXIT"]
-        selected = 0
+            # Re-layout after a terminal resize, any other key returns
+            if key != curses.KEY_RESIZE:
+                break
+            self._handle_resize()
+
+    def draw_menu_option(self, y, x, option, selected):
+        """Draw one main menu row."""
+        option_text = f"  {option}  "
+        if selected:
+            self.stdscr.addstr(y, x - 2, ">>", self.CP[2])
+            self.stdscr.addstr(y, x, option_text, self.CP_REV_BOLD[3])
+            self.stdscr.addstr(y, x + len(option_text), "<<", self.CP[2])
+        else:
+            self.stdscr.addstr(y, x, option_text, self.CP[6])
 
-        while True:
-            self.stdscr.clear()
-            h, w = self.stdscr.getmaxyx()
+    def _draw_menu_chrome(self, n_options):
+        """Draw the static parts of the main menu, returns the menu box (x, y, width)."""
+        self.stdscr.erase()
+        h, w = self._h, self._w
 
-            # Qliz branding at top
-            self.center_text(2, "━━━ QLIZ ━━━", color=1)
+        # Qliz branding at top
+        self.center_text(2, "━━━ QLIZ ━━━", color=1)
 
-            # Title with big styling
-            title = self.quiz_metadata.get('title', 'QUIZ GAME')
-            self.draw_big_title(4, title, color=2)
+        # Title with big styling
+        title = self.quiz_metadata.get('title', 'QUIZ GAME')
+        self.draw_big_title(4, title, color=2)
 
-            # Menu box
-            box_width = 40
-            box_height = len(menu_options) + 4
-            box_x = (w - box_width) // 2
-            box_y = (h - box_height) // 2 + 1
+        # Menu box
+        box_width = 40
+        box_height = n_options + 4
+        box_x = (w - box_width) // 2
+        box_y = (h - box_height) // 2 + 1
 
-            self.draw_box(box_y, box_x, box_height, box_width, "MAIN MENU", color=1)
+        self.draw_box(box_y, box_x, box_height, box_width, "MAIN MENU", color=1)
 
-            # Menu options
-            for i, option in enumerate(menu_options):
-                option_y = box_y + 2 + i
-                option_text = f"  {option}  "
-                option_x = box_x + (box_width - len(option_text)) // 2
+        # Instructions
+        instructions = "↑/↓: Navigate  |  ENTER: Select  |  Q: Quit"
+        self.center_text(h - 3, instructions, color=2)
 
-                if i == selected:
-                    self.stdscr.addstr(option_y, option_x - 2, ">>", curses.color_pair(2))
-                    self.stdscr.addstr(option_y, option_x, option_text, curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
-                    self.stdscr.addstr(option_y, option_x + len(option_text), "<<", curses.color_pair(2))
-                else:
-                    self.stdscr.addstr(option_y, option_x, option_text, curses.color_pair(6))
+        # Footer
+        footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
+        self.center_text(h - 2, footer_msg, color=6)
 
-            # Instructions
-            instructions = "↑/↓: Navigate  |  ENTER: Select  |  Q: Quit"
-            self.center_text(h - 3, instructions, color=2)
+        return box_x, box_y, box_width
 
-            # Footer
-            footer_msg = "Made with ❤️  and sleepless nights by @jmlero"
-            self.center_text(h - 2, footer_msg, color=6)
+    def main_menu(self):
+        """Main menu with branding from config."""
+        menu_options = ["PLAY GAME", "HIGH SCORES", "TOP 5 PLAYERS", "RANDOM PLAYER", "EXIT"]
+        selected = prev_selected = 0
+        full_redraw = True  # Chrome needs drawing: first entry, after a sub-screen or a resize
+        dirty = True  # Anything to draw at all, other keys go straight back to getch
 
-            self.stdscr.refresh()
+        while True:
+            if dirty:
+                if full_redraw:
+                    box_x, box_y, box_width = self._draw_menu_chrome(len(menu_options))
+
+                    # Menu options, centered in the box
+                    option_xs = [box_x + (box_width - len(option) - 4) // 2 for option in menu_options]
+                    for i, option in enumerate(menu_options):
+                        self.draw_menu_option(box_y + 2 + i, option_xs[i], option, i == selected)
+                elif selected != prev_selected:
+                    # Only the old and new highlighted rows change, blank them inside the box
+                    for i in (prev_selected, selected):
+                        self.stdscr.hline(box_y + 2 + i, box_x + 1, ' ', box_width - 2)
+                        self.draw_menu_option(box_y + 2 + i, option_xs[i], menu_options[i], i == selected)
+
+                prev_selected = selected
+                full_redraw = dirty = False
+                self.stdscr.noutrefresh()
+                self.flush_frame()
 
             # Handle input
             key = self.stdscr.getch()
 
-            if key == curses.KEY_UP:
-                selected = (selected - 1) % len(menu_options)
-            elif key == curses.KEY_DOWN:
-                selected = (selected + 1) % len(menu_options)
+            if key in self._nav_keys:
+                # Coalesce queued auto-repeat arrows into a single move and redraw
+                steps = self._nav_keys[key]
+                self.stdscr.timeout(0)
+                key = self.stdscr.getch()
+                while key in self._nav_keys:
+                    steps += self._nav_keys[key]
+                    key = self.stdscr.getch()
+                self.stdscr.timeout(-1)
+                if key != -1:
+                    curses.ungetch(key)  # Not an arrow, handle it next round
+                selected = (selected + steps) % len(menu_options)
+                dirty = selected != prev_selected
             elif key == ord('\n'):
                 if selected == 0:  # Play game
                     player = self.register_player()
@@ -972,8 +1245,11 @@ class Qliz:
                     self.random_player_picker()
                 elif selected == 4:  # Exit
                     break
+                full_redraw = dirty = True
             elif key in [ord('q'), ord('Q')]:
                 break
+            elif key == curses.KEY_RESIZE and self._handle_resize():
+                full_redraw = dirty = True
 
     def run(self):
         """Run the quiz game."""